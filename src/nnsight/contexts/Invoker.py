@@ -4,9 +4,12 @@ import copy
 from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
 
+import torch
 from torch._subclasses.fake_tensor import FakeCopyMode, FakeTensorMode
 from torch.fx.experimental.symbolic_shapes import ShapeEnv
 
+from .. import util
+
 if TYPE_CHECKING:
 
     from .Tracer import Tracer
@@ -61,6 +64,22 @@ class Invoker(AbstractContextManager):
             
             self.scanning = True
 
+            # The deepcopy of the inputs is what converts their tensors into FakeTensors
+            # (via FakeCopyMode). The tracer kwargs usually hold no tensors at all though,
+            # so only pay for their deepcopy when there is actually something to fake-copy.
+            kwargs = self.tracer._kwargs
+
+            has_tensor = False
+
+            def flag_tensor(tensor: torch.Tensor):
+                nonlocal has_tensor
+
+                has_tensor = True
+
+                return tensor
+
+            util.apply(kwargs, flag_tensor, torch.Tensor)
+
             with FakeTensorMode(
                 allow_non_fake_inputs=True,
                 shape_env=ShapeEnv(assume_static_by_default=True),
@@ -68,7 +87,7 @@ class Invoker(AbstractContextManager):
                 with FakeCopyMode(fake_mode):
                     self.tracer._model._execute(
                         *copy.deepcopy(self.inputs),
-                        **copy.deepcopy(self.tracer._kwargs),
+                        **(copy.deepcopy(kwargs) if has_tensor else kwargs),
                     )
                     
             self.scanning = False
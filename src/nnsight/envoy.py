@@ -42,6 +42,8 @@ class Envoy:
 
         self._tracer: Tracer = None
 
+        self._invalidate: Callable = None
+
         self._module = module
         self._sub_envoys: List[Envoy] = []
 
@@ -52,7 +54,10 @@ class Envoy:
 
         for name, module in self._module.named_children():
 
-            setattr(self, name, module)
+            # The child is already registered on the underlying module, so build its Envoy
+            # directly instead of going through __setattr__ which would re-register it via
+            # the (comparatively costly) torch.nn.Module.__setattr__.
+            self._add_envoy(module, name)
 
     def _update(self, module: torch.nn.Module) -> None:
         """Updates the ._model attribute using a new model of the same architecture.
@@ -76,6 +81,9 @@ class Envoy:
 
         envoy = Envoy(module, module_path=f"{self._module_path}.{name}")
 
+        if self._invalidate is not None:
+            envoy._set_invalidate(self._invalidate, propagate=True)
+
         self._sub_envoys.append(envoy)
 
         # If the module already has a sub-module named 'input' or 'output',
@@ -132,6 +140,21 @@ class Envoy:
             for envoy in self._sub_envoys:
                 envoy._set_tracer(tracer, propagate=True)
 
+    def _set_invalidate(self, invalidate: Callable, propagate=True):
+        """Set callback invoked when a module is replaced through this Envoy.
+        Lets the owning model drop state resolved against the replaced modules.
+
+        Args:
+            invalidate (Callable): Callback to invoke.
+            propagate (bool, optional): If to propagate to all sub-modules. Defaults to True.
+        """
+
+        self._invalidate = invalidate
+
+        if propagate:
+            for envoy in self._sub_envoys:
+                envoy._set_invalidate(invalidate, propagate=True)
+
     def _scanning(self) -> bool:
 
         try:
@@ -187,6 +210,9 @@ class Envoy:
             for envoy in self._sub_envoys:
                 envoy._clear(propagate=True)
 
+    # Excluded from torch.compile: this hook fires inside compiled blocks and its tracer
+    # access is untraceable by Dynamo. Disabling makes Dynamo call it eagerly instead of erroring.
+    @torch._dynamo.disable
     def _hook(
         self, module: torch.nn.Module, input: Any, input_kwargs: Dict, output: Any
     ):
@@ -217,6 +243,9 @@ class Envoy:
     ) -> List[Envoy]:
         """Returns all Envoys in the Envoy tree.
 
+        Walks the tree iteratively so deep models don't pay a Python frame (or risk hitting
+        the recursion limit) per module.
+
         Args:
             include_fn (Callable, optional): Optional function to be ran against all Envoys to check if they should be included in the final collection of Envoys. Defaults to None.
             names (bool, optional): If to include the name/module_path of returned Envoys along with the Envoy itself. Defaults to False.
@@ -228,19 +257,25 @@ class Envoy:
         if envoys is None:
             envoys = list()
 
-        included = True
+        stack = [self]
 
-        if include_fn is not None:
-            included = include_fn(self)
+        while stack:
 
-        if included:
-            if names:
-                envoys.append((self._module_path, self))
-            else:
-                envoys.append(self)
+            envoy = stack.pop()
 
-        for sub_envoy in self._sub_envoys:
-            sub_envoy.modules(include_fn=include_fn, envoys=envoys)
+            included = True
+
+            if include_fn is not None:
+                included = include_fn(envoy)
+
+            if included:
+                if names:
+                    envoys.append((envoy._module_path, envoy))
+                else:
+                    envoys.append(envoy)
+
+            # Reversed so the walk visits sub-Envoys in registration (pre-)order.
+            stack.extend(reversed(envoy._sub_envoys))
 
         return envoys
 
@@ -382,6 +417,10 @@ class Envoy:
 
             self._add_envoy(value, key)
 
+            # The previous module at this path may be cached elsewhere (e.g. resolved hook targets).
+            if self._invalidate is not None:
+                self._invalidate()
+
         else:
 
             super().__setattr__(key, value)
@@ -220,9 +220,13 @@ def concat(
     def _concat(values):
         if isinstance(values[0], torch.Tensor):
             orig_size = values[-1]
-            new_size = sum([value.shape[0] for value in values[:-1]])
+            new_size = sum(value.shape[0] for value in values[:-1])
             if new_size == orig_size:
-                return torch.concatenate(values[:-1])
+                # At the batch boundaries the pre-slice (first invocation) or the
+                # post-slice (last invocation) is zero-length; dropping it
+                # concatenates two pieces instead of three.
+                pieces = [value for value in values[:-1] if value.shape[0] > 0]
+                return torch.concatenate(pieces)
             return values[0]
         elif isinstance(values[0], list):
             return [
@@ -303,15 +307,19 @@ def intervene(
     # Key to module activation argument nodes has format: <module path>.<output/input>
     module_path = f"{module_path}.{key}"
 
-    if module_path in intervention_handler.graph.argument_node_names:
-        argument_node_names = intervention_handler.graph.argument_node_names[
-            module_path
-        ]
+    # This runs once per hooked activation, so look the key up once and keep the
+    # graph in a local rather than re-resolving attributes per argument node.
+    # (The graph structures are too dynamic for torch.jit.script/torch.compile here.)
+    graph = intervention_handler.graph
+
+    argument_node_names = graph.argument_node_names.get(module_path)
+
+    if argument_node_names is not None:
 
         # Multiple argument nodes can have same module_path if there are multiple invocations.
         for argument_node_name in argument_node_names:
 
-            node = intervention_handler.graph.nodes[argument_node_name]
+            node = graph.nodes[argument_node_name]
 
             # Args for argument nodes are (module_path, batch_size, batch_start, call_iter).
             _, batch_size, batch_start, call_iter = node.args
@@ -352,7 +360,7 @@ def intervene(
 
             # Check if through the previous value injection, there was a 'swap' intervention.
             # This would mean we want to replace activations for this batch with some other ones.
-            value = intervention_handler.graph.get_swap(value)
+            value = graph.get_swap(value)
 
             # If we narrowed any data, we need to concat it with data before and after it.
             if narrowed:
@@ -379,11 +387,13 @@ class HookHandler(AbstractContextManager):
 
     Attributes:
         model (torch.nn.Module): Root model to access modules and apply hooks to.
-        modules (List[Tuple[torch.nn.Module, str]]): List of modules to apply hooks to along with their module_path.
         input_hook (Callable): Function to apply to inputs of designated modules.
             Should have signature of [inputs(Any), module_path(str)] -> inputs(Any)
         output_hook (Callable): Function to apply to outputs of designated modules.
             Should have signature of [outputs(Any), module_path(str)] -> outputs(Any)
+        modules (List[Tuple[torch.nn.Module, str, str]]): Optional pre-resolved (module, module_path, hook_type) entries
+            from .resolve(...), resolved lazily on __enter__ if not given. Lets callers that hook the same fixed set
+            repeatedly skip re-walking the model per call.
         handles (List[RemovableHandle]): Handles returned from registering hooks as to be used when removing hooks on __exit__.
     """
 
@@ -393,6 +403,7 @@ class HookHandler(AbstractContextManager):
         module_keys: List[str],
         input_hook: Callable = None,
         output_hook: Callable = None,
+        modules: List[Tuple[torch.nn.Module, str, str]] = None,
     ) -> None:
         self.model = model
         self.module_keys = module_keys
@@ -400,27 +411,58 @@ class HookHandler(AbstractContextManager):
         self.input_hook = input_hook
         self.output_hook = output_hook
 
+        self.modules = modules
+
         self.handles: List[RemovableHandle] = []
 
-    def __enter__(self) -> HookHandler:
-        """Registers input and output hooks to modules if they are defined.
+    @staticmethod
+    def resolve(
+        model: torch.nn.Module, module_keys: List[str]
+    ) -> List[Tuple[torch.nn.Module, str, str]]:
+        """Resolves module keys of format <module_path>.<input/output> into (module, module_path, hook_type) entries.
+
+        Args:
+            model (torch.nn.Module): Root model to fetch modules from.
+            module_keys (List[str]): Module keys to resolve. Keys without a '.' (reserved names) are skipped.
 
         Returns:
-            HookModel: HookModel object.
+            List[Tuple[torch.nn.Module, str, str]]: Resolved entries.
         """
 
-        for module_key in self.module_keys:
+        modules = []
 
-            module_atoms = module_key.split(".")
+        for module_key in module_keys:
 
-            if len(module_atoms) == 1:
+            # Reserved names like the root module node have no '.' and are not hooked.
+            if "." not in module_key:
                 continue
 
-            *module_atoms, hook_type = module_atoms
+            # Module keys have format <module_path>.<input/output>. A single rpartition
+            # splits off the hook type without the split/join round-trip over every atom.
+            # An empty module_path (e.g. '.output') refers to the root model itself.
+            module_path, _, hook_type = module_key.rpartition(".")
 
-            module_path = ".".join(module_atoms)
+            modules.append(
+                (util.fetch_attr(model, module_path), module_path, hook_type)
+            )
 
-            module: torch.nn.Module = util.fetch_attr(self.model, module_path)
+        return modules
+
+    def __enter__(self) -> HookHandler:
+        """Registers input and output hooks to modules if they are defined.
+
+        Returns:
+            HookModel: HookModel object.
+        """
+
+        # Nothing to register; skip the walk entirely.
+        if not self.module_keys:
+            return self
+
+        if self.modules is None:
+            self.modules = self.resolve(self.model, self.module_keys)
+
+        for module, module_path, hook_type in self.modules:
 
             if hook_type == "input":
 
@@ -459,13 +501,10 @@ class InterventionHandler:
         self.call_counter: Dict[str, int] = {}
 
     def count(self, name: str):
+        """Returns (and updates) the call count for the given argument node. Starts at 0."""
 
-        if name not in self.call_counter:
-
-            self.call_counter[name] = 0
-
-        else:
+        count = self.call_counter.get(name, -1) + 1
 
-            self.call_counter[name] += 1
+        self.call_counter[name] = count
 
-        return self.call_counter[name]
+        return count
@@ -148,6 +148,19 @@ class LanguageModel(GenerationMixin, NNsight):
     def _load(
         self, repo_id: str, tokenizer_kwargs: Optional[Dict[str, Any]] = None, **kwargs
     ) -> PreTrainedModel:
+        """Loads the model, either as a meta skeleton (pre-dispatch) or with real weights (dispatch).
+
+        Supports reduced-precision loading via the standard `torch_dtype` kwarg (as a torch.dtype
+        or its string name, e.g. "bfloat16"), halving weight memory and doubling effective memory
+        bandwidth for bf16/fp16 versus fp32. The dtype is also applied to the meta skeleton so
+        scanned fake tensors report the same dtypes as the dispatched model.
+        """
+
+        torch_dtype = kwargs.get("torch_dtype", None)
+
+        # Accept string dtype names; "auto" is resolved by from_pretrained at dispatch time.
+        if isinstance(torch_dtype, str) and torch_dtype != "auto":
+            kwargs["torch_dtype"] = torch_dtype = getattr(torch, torch_dtype)
 
         config = kwargs.pop("config", None) or AutoConfig.from_pretrained(repo_id, **kwargs)
 
@@ -167,7 +180,13 @@ class LanguageModel(GenerationMixin, NNsight):
 
         if self._model is None:
 
-            model = self.automodel.from_config(config, trust_remote_code=True)
+            model = self.automodel.from_config(
+                config,
+                trust_remote_code=True,
+                torch_dtype=(
+                    torch_dtype if isinstance(torch_dtype, torch.dtype) else None
+                ),
+            )
             
             setattr(model, 'generator', WrapperModule())
 
@@ -284,13 +303,51 @@ class LanguageModel(GenerationMixin, NNsight):
 
         return (batched_inputs,)
 
+    def _to_device(
+        self, prepared_inputs: BatchEncoding, device: torch.device
+    ) -> BatchEncoding:
+        """Moves tokenizer outputs to the given device.
+
+        For CUDA targets, CPU tensors are staged in pinned host memory and copied with
+        non_blocking=True so the host-to-device transfer overlaps with Python-side setup
+        instead of synchronizing on a pageable copy.
+
+        Args:
+            prepared_inputs (BatchEncoding): Tokenizer outputs to move.
+            device (torch.device): Device to move them to.
+
+        Returns:
+            BatchEncoding: Moved tokenizer outputs.
+        """
+
+        if device.type != "cuda":
+            return prepared_inputs.to(device)
+
+        moved = {}
+
+        for key, value in prepared_inputs.items():
+
+            if isinstance(value, torch.Tensor):
+
+                if value.device.type == "cpu":
+                    value = value.pin_memory().to(device, non_blocking=True)
+
+                elif value.device != device:
+                    # Already on an accelerator (e.g. another CUDA device); pinning does
+                    # not apply but the tensor still needs to end up on the model's device.
+                    value = value.to(device, non_blocking=True)
+
+            moved[key] = value
+
+        return BatchEncoding(moved)
+
     def _execute_forward(self, prepared_inputs: Any, *args, **kwargs):
 
         device = next(self._model.parameters()).device
 
         return self._model(
             *args,
-            **prepared_inputs.to(device),
+            **self._to_device(prepared_inputs, device),
             **kwargs,
         )
 
@@ -302,7 +359,7 @@ class LanguageModel(GenerationMixin, NNsight):
 
         output = self._model.generate(
             *args,
-            **prepared_inputs.to(device),
+            **self._to_device(prepared_inputs, device),
             max_new_tokens=max_new_tokens,
             **kwargs,
         )
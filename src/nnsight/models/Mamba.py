@@ -21,6 +21,39 @@ from .LanguageModel import LanguageModel
 
 from torch._guards import detect_fake_mode
 
+
+def _fake_mode_patcher() -> Patcher:
+    """Builds the Patcher that stubs out Mamba's CUDA kernels so scanning with fake/'meta' tensors works.
+
+    Only constructed when fake mode is detected; real execution skips building the patches entirely.
+    """
+
+    def blah(hs, *args, residual=None, **kwargs):
+        return hs, residual or torch.rand_like(hs)
+
+    def blah1(hs, *args, **kwargs):
+        return hs
+
+    def blah2(hs, *args, **kwargs):
+        return hs
+
+    def blah3(conv1d_out, delta, A, B, C, D, z, delta_bias, delta_softplus):
+        return (
+            conv1d_out,
+            torch.zeros((*conv1d_out.shape, A.shape[1] * 2), device="meta"),
+            conv1d_out,
+        )
+
+    return Patcher(
+        [
+            Patch(mamba_ssm.modules.mamba_simple, blah, "rms_norm_fn"),
+            Patch(mamba_ssm.models.mixer_seq_simple, blah1, "rms_norm_fn"),
+            Patch(causal_conv1d_cuda, blah2, "causal_conv1d_fwd"),
+            Patch(selective_scan_cuda, blah3, "fwd"),
+        ]
+    )
+
+
 class Mamba(LanguageModel):
 
     def _load(self, repo_id: str, device='cpu', **kwargs) -> PreTrainedModel:
@@ -53,42 +86,21 @@ class Mamba(LanguageModel):
 
         device = next(self._model.parameters()).device
 
-        patcher = None
-
-        with Patcher() as patcher:
-
-            if detect_fake_mode(prepared_inputs):
-
-                def blah(hs, *args, residual=None, **kwargs):
-                    return hs, residual or torch.rand_like(hs)
-
-                def blah1(hs, *args, **kwargs):
-                    return hs
+        if detect_fake_mode(prepared_inputs):
 
-                def blah2(hs, *args, **kwargs):
-                    return hs
+            with _fake_mode_patcher():
 
-                def blah3(conv1d_out, delta, A, B, C, D, z, delta_bias, delta_softplus):
-                    return (
-                        conv1d_out,
-                        torch.zeros((*conv1d_out.shape, A.shape[1] * 2), device="meta"),
-                        conv1d_out,
-                    )
-
-                
-                patcher.add(Patch(mamba_ssm.modules.mamba_simple, blah, "rms_norm_fn"))
-                patcher.add(
-                    Patch(mamba_ssm.models.mixer_seq_simple, blah1, "rms_norm_fn")
+                return self._model(
+                    prepared_inputs["input_ids"].to(device),
+                    *args,
+                    **kwargs,
                 )
-                patcher.add(Patch(causal_conv1d_cuda, blah2, "causal_conv1d_fwd"))
-                patcher.add(Patch(selective_scan_cuda, blah3, "fwd"))
-
 
-            return self._model(
-                prepared_inputs["input_ids"].to(device),
-                *args,
-                **kwargs,
-            )
+        return self._model(
+            prepared_inputs["input_ids"].to(device),
+            *args,
+            **kwargs,
+        )
 
     def _execute_generate(
         self, prepared_inputs: Any, *args, max_length=1, **kwargs
@@ -96,35 +108,18 @@ class Mamba(LanguageModel):
 
         device = next(self._model.parameters()).device
 
-        patcher = None
+        if detect_fake_mode(prepared_inputs):
 
-        with Patcher() as patcher:
+            with _fake_mode_patcher():
 
-            if detect_fake_mode(prepared_inputs):
-
-                def blah(hs, *args, residual=None, **kwargs):
-                    return hs, residual or torch.rand_like(hs)
-
-                def blah1(hs, *args, **kwargs):
-                    return hs
-
-                def blah2(hs, *args, **kwargs):
-                    return hs
-
-                def blah3(conv1d_out, delta, A, B, C, D, z, delta_bias, delta_softplus):
-                    return (
-                        conv1d_out,
-                        torch.zeros((*conv1d_out.shape, A.shape[1] * 2), device="meta"),
-                        conv1d_out,
-                    )
-
-                
-                patcher.add(Patch(mamba_ssm.modules.mamba_simple, blah, "rms_norm_fn"))
-                patcher.add(
-                    Patch(mamba_ssm.models.mixer_seq_simple, blah1, "rms_norm_fn")
+                output = self._model.generate(
+                    prepared_inputs["input_ids"].to(device),
+                    *args,
+                    max_length=max_length,
+                    **kwargs,
                 )
-                patcher.add(Patch(causal_conv1d_cuda, blah2, "causal_conv1d_fwd"))
-                patcher.add(Patch(selective_scan_cuda, blah3, "fwd"))
+
+        else:
 
             output = self._model.generate(
                 prepared_inputs["input_ids"].to(device),
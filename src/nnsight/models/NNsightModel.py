@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import gc
+import os
+import weakref
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import accelerate
@@ -30,6 +32,8 @@ class NNsight:
         kwargs (Dict[str,Any]): Keyword arguments used to initialize model.
         dispatched (bool): If the _model has been loaded yet with real parameters yet.
         custom_model (bool): If the value passed to repoid_path_model was a custom model.
+        compile (bool): If to wrap ._model with torch.compile once dispatched. Cuts per-call Python/dispatcher overhead which is especially valuable for iterative generation.
+        compile_mode (str): Mode to pass to torch.compile. Defaults to "reduce-overhead", which has Inductor capture CUDA graphs for the compiled blocks so the small per-token kernels of the decode path launch as one graph replay instead of individual launches.
         _model (torch.nn.Module): Underlying torch module.
     """
 
@@ -40,6 +44,8 @@ class NNsight:
         model_key: Union[str, torch.nn.Module],
         *args,
         dispatch: bool = False,
+        compile: bool = False,
+        compile_mode: str = "reduce-overhead",
         **kwargs,
     ) -> None:
         super().__init__()
@@ -49,12 +55,32 @@ class NNsight:
         self._args = args
         self._kwargs = kwargs
 
+        self._compile = compile
+        self._compile_mode = compile_mode
+
+        # Candidate blocks for piecewise compilation. Maps module_path -> (parent ModuleList, index, original module).
+        self._compile_candidates: Dict[
+            str, Tuple[torch.nn.ModuleList, int, torch.nn.Module]
+        ] = {}
+        # Cache of already compiled blocks so Dynamo only runs once per block. Maps module_path -> compiled module.
+        self._compiled_blocks: Dict[str, torch.nn.Module] = {}
+        # Whole-model compiled wrapper for models with no candidate blocks. Swapped in per-call like the blocks.
+        self._compiled_model: torch.nn.Module = None
+
+        # Cache of module keys per intervention graph, keyed on graph identity and validated against the graph's version.
+        self._graph_cache: Dict[int, Tuple[weakref.ref, int, List[str]]] = {}
+
+        # Cache of resolved hook targets per fixed set of module keys. Cleared on dispatch as the modules are replaced.
+        self._hook_cache: Dict[
+            Tuple[str, ...], List[Tuple[torch.nn.Module, str, str]]
+        ] = {}
+
         self._dispatched = False
         self._custom_model = False
 
         self._model: torch.nn.Module = None
 
-        logger.info(f"Initializing `{self._model_key}`...")
+        logger.info("Initializing `%s`...", self._model_key)
 
         # Handle passing in a pre-initialized model to wrap.
         # Therefore the NNsight model is "pre-dispatched".
@@ -64,20 +90,33 @@ class NNsight:
             self._dispatched = True
             self._model = model_key
 
+        if self._compile:
+            # Point Inductor at an on-disk cache so repeat runs skip codegen.
+            self._setup_inductor_cache()
+
         # Otherwise load from _load(...).
         if not self._custom_model:
-            # accelerate.init_empty_weights makes all parameters loaded on the 'meta' device.
-            # Also do .to('meta') because why not.
-            with accelerate.init_empty_weights(include_buffers=True):
-                self._model = self._load(self._model_key, *args, **kwargs).to("meta")
+            # Build the module directly on the 'meta' device so parameters and buffers are
+            # never materialized just to be thrown away. Skips both the real allocations and
+            # the .to('meta') pass the accelerate.init_empty_weights route needed.
+            with torch.device("meta"):
+                self._model = self._load(self._model_key, *args, **kwargs)
 
         self._envoy = Envoy(self._model)
 
+        # Setting a module through an Envoy (e.g. `model.layer2 = ...`) detaches the module
+        # any cached hook targets resolved to, so have the Envoy tree drop the cache.
+        self._envoy._set_invalidate(self._invalidate_hook_cache)
+
         if dispatch and not self._dispatched:
             # Dispatch ._model on initialization vs lazy dispatching.
             self.dispatch_model()
+
+        elif self._dispatched and self._compile:
+            # Pre-initialized models never go through dispatch_model, so compile here.
+            self._compile_model()
                     
-        logger.info(f"Initialized `{self._model_key}`")
+        logger.info("Initialized `%s`", self._model_key)
 
     def trace(
         self,
@@ -234,7 +273,7 @@ class NNsight:
         if not self._dispatched:
             self.dispatch_model()
 
-        logger.info(f"Running `{self._model_key}`...")
+        logger.info("Running `%s`...", self._model_key)
 
         intervention_graph.compile(self._model)
 
@@ -242,29 +281,102 @@ class NNsight:
 
         intervention_handler = InterventionHandler(intervention_graph, total_batch_size)
 
-        with HookHandler(
-            self._model,
-            list(intervention_graph.argument_node_names.keys()),
-            input_hook=lambda activations, module_path: intervene(
-                activations, module_path, "input", intervention_handler
-            ),
-            output_hook=lambda activations, module_path: intervene(
-                activations, module_path, "output", intervention_handler
-            ),
+        # Iterative workflows interleave with the same graph many times. Re-listing the argument
+        # node names touches every entry each call, so memoize per graph until its version changes.
+        graph_key = id(intervention_graph)
+
+        cached = self._graph_cache.get(graph_key)
+
+        if (
+            cached is not None
+            and cached[0]() is intervention_graph
+            and cached[1] == intervention_graph.version
         ):
-            output = fn(*inputs, **kwargs)
+            module_keys = cached[2]
+        else:
+            module_keys = list(intervention_graph.argument_node_names.keys())
+
+            self._graph_cache[graph_key] = (
+                # Fresh graphs are the norm (every trace builds one), so evict the entry
+                # when its graph dies rather than accumulating one per call for the life
+                # of the model.
+                weakref.ref(
+                    intervention_graph,
+                    lambda _, key=graph_key: self._graph_cache.pop(key, None),
+                ),
+                intervention_graph.version,
+                module_keys,
+            )
+
+        # Module keys with no '.' are reserved names like the root module, not module activations to hook.
+        has_hooks = any("." in module_key for module_key in module_keys)
+
+        # Swap in compiled versions of un-hooked blocks, restoring the eager ones after execution
+        # so scanning and Envoy access keep seeing the original modules.
+        swap_compiled = self._compile and len(self._compile_candidates) > 0
 
-        logger.info(f"Completed `{self._model_key}`")
+        if swap_compiled:
+            self._swap_compiled_blocks(module_keys)
 
-        # gc.collect()
-        # torch.cuda.empty_cache()
+        # The whole-model fallback has no piecewise granularity, so only swap it in when the run
+        # hooks nothing at all: hooks inside a monolithic compiled graph are fixed at compile time,
+        # and a later run hooking different modules could silently miss its interventions.
+        swap_root = self._compiled_model is not None and not has_hooks
+
+        if swap_root:
+            eager_model = self._model
+
+            self._model = self._compiled_model
+
+        try:
+            if has_hooks:
+                # Re-running the same intervention pattern hooks the same fixed set of modules,
+                # so resolve each set of module keys against the model only once.
+                hook_key = tuple(module_keys)
+
+                resolved = self._hook_cache.get(hook_key)
+
+                if resolved is None:
+                    resolved = HookHandler.resolve(self._model, module_keys)
+
+                    self._hook_cache[hook_key] = resolved
+
+                # Bind intervene(...) directly rather than creating fresh closures per call.
+                # Each activation flowing through a hook pays one less Python-level call this way.
+                with HookHandler(
+                    self._model,
+                    module_keys,
+                    input_hook=partial(
+                        intervene,
+                        key="input",
+                        intervention_handler=intervention_handler,
+                    ),
+                    output_hook=partial(
+                        intervene,
+                        key="output",
+                        intervention_handler=intervention_handler,
+                    ),
+                    modules=resolved,
+                ):
+                    output = fn(*inputs, **kwargs)
+            else:
+                # Nothing to hook, so skip registering/removing hooks entirely.
+                output = fn(*inputs, **kwargs)
+        finally:
+            if swap_root:
+                self._model = eager_model
+
+            if swap_compiled:
+                self._restore_blocks()
+
+        logger.info("Completed `%s`", self._model_key)
 
         return output
 
     def dispatch_model(self, *args, **kwargs) -> None:
         """Dispatch ._model to have real parameters  using ._load(...)."""
 
-        logger.info(f"Dispatching `{self._model_key}`...")
+        logger.info("Dispatching `%s`...", self._model_key)
 
         self._model = self._load(
             self._model_key, *self._args, *args, **kwargs, **self._kwargs
@@ -272,9 +384,158 @@ class NNsight:
 
         self._envoy._update(self._model)
 
+        # Resolved hook targets point at the replaced modules.
+        self._invalidate_hook_cache()
+
         self._dispatched = True
 
-        logger.info(f"Dispatched `{self._model_key}`")
+        if self._compile:
+            self._compile_model()
+
+        logger.info("Dispatched `%s`", self._model_key)
+
+    def _invalidate_hook_cache(self) -> None:
+        """Drops resolved hook targets. Called whenever underlying modules are replaced,
+        either by dispatching or by setting a module through an Envoy."""
+
+        self._hook_cache.clear()
+
+    def _setup_inductor_cache(self) -> None:
+        """Enables Inductor's persistent FX-graph cache, keyed per model under ~/.cache/nnsight/inductor.
+
+        Without it, every fresh process pays full Dynamo tracing + Inductor codegen again when compiling.
+        With it, second and subsequent runs hit the on-disk cache and startup is near-eager.
+
+        The cache is keyed on shapes, so blocks are compiled with dynamic=True to keep the key count low.
+
+        Respects a pre-existing TORCHINDUCTOR_CACHE_DIR. No-ops on torch versions without Inductor's cache config.
+        """
+
+        os.environ.setdefault(
+            "TORCHINDUCTOR_CACHE_DIR",
+            os.path.expanduser(
+                os.path.join("~", ".cache", "nnsight", "inductor", str(self._model_key))
+            ),
+        )
+
+        try:
+
+            import torch._inductor.config
+
+            torch._inductor.config.fx_graph_cache = True
+
+            if hasattr(torch._inductor.config, "force_disable_caches"):
+                torch._inductor.config.force_disable_caches = False
+
+        except (ImportError, AttributeError):
+
+            pass
+
+    def _compile_model(self) -> None:
+        """Prepares ._model for compilation to cut eager-mode Python/dispatcher overhead on repeated forward passes.
+
+        A monolithic torch.compile would graph-break at every intervention hook, so instead we collect the repeated
+        blocks of the model (children of ModuleLists, e.g. transformer decoder layers) as candidates for piecewise
+        compilation. Which candidates actually run compiled is decided per-call in .interleave(...), as only blocks
+        not targeted by the current intervention graph can be swapped for their compiled versions.
+
+        If the model has no such blocks, a whole-model wrapper is compiled as a fallback. Like the blocks it is
+        only swapped in per-call by .interleave(...) — ._model itself stays eager so scanning (which executes the
+        model under FakeTensorMode) and Envoy access keep the original module.
+
+        No-ops on torch versions without torch.compile.
+        """
+
+        if not hasattr(torch, "compile"):
+
+            logger.warning(
+                f"torch.compile not available in torch {torch.__version__}. Skipping compilation of `{self._model_key}`"
+            )
+
+            return
+
+        self._compile_candidates = {}
+        self._compiled_blocks = {}
+        self._compiled_model = None
+
+        for name, module in self._model.named_modules():
+
+            # Skip modules inside an already collected block.
+            if any(
+                name.startswith(f"{block_path}.")
+                for block_path in self._compile_candidates
+            ):
+                continue
+
+            if isinstance(module, torch.nn.ModuleList):
+
+                for idx, block in enumerate(module):
+
+                    block_path = f"{name}.{idx}" if name else str(idx)
+
+                    self._compile_candidates[block_path] = (module, idx, block)
+
+        if len(self._compile_candidates) == 0:
+
+            self._compiled_model = torch.compile(
+                self._model, mode=self._compile_mode, dynamic=False
+            )
+
+    def _swap_compiled_blocks(self, module_keys: List[str]) -> None:
+        """Swaps compiled versions into ._model for all candidate blocks not targeted by the given intervention module keys.
+
+        Hooked blocks (and blocks containing hooked modules) are left eager so intervene(...) still fires on them.
+        Compiled blocks are cached so Dynamo only traces each block once across calls.
+
+        Args:
+            module_keys (List[str]): Module keys of the current intervention graph in the form <module_path>.<input/output>.
+        """
+
+        hooked_paths = set()
+
+        for module_key in module_keys:
+
+            module_path = module_key.rpartition(".")[0]
+
+            # Envoy module paths carry a leading '.' (the root path is ''), while
+            # candidate paths come from named_modules() which does not. Strip it so
+            # the comparisons below actually line up. A hooked root (path '') does
+            # not keep any block eager as its hooks fire outside the blocks.
+            if module_path:
+                hooked_paths.add(module_path.lstrip("."))
+
+        for block_path, (
+            module_list,
+            idx,
+            block,
+        ) in self._compile_candidates.items():
+
+            prefix = f"{block_path}."
+
+            if any(
+                path == block_path or path.startswith(prefix)
+                for path in hooked_paths
+            ):
+                continue
+
+            compiled = self._compiled_blocks.get(block_path)
+
+            if compiled is None:
+
+                compiled = torch.compile(
+                    block, mode=self._compile_mode, dynamic=True
+                )
+
+                self._compiled_blocks[block_path] = compiled
+
+            module_list[idx] = compiled
+
+    def _restore_blocks(self) -> None:
+        """Restores the original eager blocks swapped out by ._swap_compiled_blocks(...)."""
+
+        for module_list, idx, block in self._compile_candidates.values():
+
+            module_list[idx] = block
 
     def to(self, *args, **kwargs) -> Self:
         """Override torch.nn.Module.to so this returns the NNSight model, not the underlying module when doing: model = model.to(...)
@@ -298,7 +559,7 @@ class NNsight:
     def __setattr__(self, key: Any, value: Any) -> None:
         """Overload setattr to create and set an Envoy when trying to set a torch Module."""
 
-        if key not in ('_model', '_model_key') and isinstance(value, torch.nn.Module):
+        if key not in ('_model', '_model_key', '_compiled_model') and isinstance(value, torch.nn.Module):
             
             setattr(self._envoy, key, value)
 
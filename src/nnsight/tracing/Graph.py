@@ -34,6 +34,7 @@ class Graph:
         argument_node_names (Dict[str, List[str]]): Map of name of argument to name of nodes that depend on it.
         generation_idx (int): Current generation index.
         swap (Node): Attribute to store swap values from 'swap' nodes.
+        version (int): Counter incremented every time a node is added. Used to invalidate caches derived from the graph's structure.
     """
 
     def __init__(
@@ -55,6 +56,8 @@ class Graph:
 
         self.swap: Node = None
 
+        self.version: int = 0
+
         self.module_proxy = self.add(
             value=module, target="argument", args=["nnsight_root_module"]
         )
@@ -173,6 +176,8 @@ class Graph:
 
         self.nodes[name] = node
 
+        self.version += 1
+
         if target_name == "argument":
             module_path = args[0]
 
@@ -0,0 +1,119 @@
+import gc
+from collections import OrderedDict
+
+import pytest
+import torch
+
+from nnsight import NNsight
+
+
+class _Block(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.lin = torch.nn.Linear(8, 8)
+
+    def forward(self, x):
+        return torch.relu(self.lin(x))
+
+
+class _BlockModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.layers = torch.nn.ModuleList([_Block() for _ in range(3)])
+
+    def forward(self, x):
+        for layer in self.layers:
+            x = layer(x)
+        return x
+
+
+def _flat_module() -> torch.nn.Module:
+    return torch.nn.Sequential(
+        OrderedDict(
+            [
+                ("layer1", torch.nn.Linear(5, 10)),
+                ("sigma1", torch.nn.Sigmoid()),
+                ("layer2", torch.nn.Linear(10, 2)),
+            ]
+        )
+    )
+
+
+@pytest.fixture
+def flat_model():
+    return NNsight(_flat_module())
+
+
+def test_module_replacement_invalidates_hook_cache(flat_model: NNsight):
+    x = torch.rand(2, 5)
+
+    with flat_model.trace(x):
+        before = flat_model.layer2.output.save()
+
+    assert before.value.shape == (2, 2)
+
+    flat_model.layer2 = torch.nn.Linear(10, 3)
+
+    with flat_model.trace(x):
+        after = flat_model.layer2.output.save()
+
+    assert after.value.shape == (2, 3)
+
+
+def test_repeated_traces_reuse_and_evict_caches(flat_model: NNsight):
+    x = torch.rand(2, 5)
+
+    expected = flat_model._model(x)
+
+    for _ in range(5):
+        with flat_model.trace(x):
+            output = flat_model.output.save()
+
+        assert torch.allclose(output.value, expected)
+
+    gc.collect()
+
+    # Dead graphs evict their module-key entries instead of accumulating per trace.
+    assert len(flat_model._graph_cache) <= 1
+
+
+def test_compile_piecewise_leaves_hooked_blocks_eager():
+    model = NNsight(_BlockModel(), compile=True, compile_mode="default")
+
+    assert sorted(model._compile_candidates) == ["layers.0", "layers.1", "layers.2"]
+
+    x = torch.rand(2, 8)
+
+    with model.trace(x):
+        hs = model.layers[1].lin.output.save()
+
+    assert hs.value.shape == (2, 8)
+    assert sorted(model._compiled_blocks) == ["layers.0", "layers.2"]
+
+    # Eager blocks are restored after execution.
+    for module_list, idx, block in model._compile_candidates.values():
+        assert module_list[idx] is block
+
+
+def test_compile_fallback_keeps_model_eager():
+    module = _flat_module()
+
+    model = NNsight(module, compile=True, compile_mode="default")
+
+    # No ModuleList blocks, so the whole-model wrapper is built instead.
+    assert len(model._compile_candidates) == 0
+    assert model._compiled_model is not None
+
+    x = torch.rand(2, 5)
+
+    # Scanning executes ._model under FakeTensorMode; it must stay eager.
+    with model.trace(x):
+        output = model.layer2.output.save()
+
+    assert torch.allclose(output.value, module(x))
+
+    # A hook-free run swaps the compiled wrapper in and restores the eager module.
+    with model.trace(x, scan=False):
+        pass
+
+    assert model._model is not model._compiled_model